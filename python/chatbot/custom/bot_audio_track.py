@@ -1,13 +1,11 @@
 import asyncio
-import base64
 import fractions
 import logging
-import threading
 
 import numpy as np
+import pybase64
 from aiortc.mediastreams import MediaStreamError, MediaStreamTrack
 from av import AudioFrame
-from av.audio.fifo import AudioFifo
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +13,8 @@ logger = logging.getLogger(__name__)
 class BotAudioTrack(MediaStreamTrack):
     kind = "audio"
 
+    RING_SECONDS = 5  # seconds of buffered audio before old samples drop
+
     def __init__(self):
         super().__init__()
 
@@ -26,41 +26,137 @@ class BotAudioTrack(MediaStreamTrack):
         self._start = None
         self._timestamp = 0
 
+        # Cached on first recv; avoids the deprecated get_event_loop walk
+        # and a divide on every 20 ms tick
+        self._loop = None
+        self._sample_period = 1.0 / self.sample_rate
+
         self.AUDIO_PTIME = 0.020  # 20ms audio packetization
         self.frame_samples = int(self.AUDIO_PTIME * self.sample_rate)
 
-        # Audio FIFO buffer
-        self.audio_fifo = AudioFifo()
-        self.fifo_lock = threading.Lock()
+        # Lock-free SPSC ring of raw int16 samples: the websocket task is
+        # the only writer of _write_pos and recv the only writer of
+        # _read_pos, so plain int assignment under the GIL is enough
+        self._ring_size = self.sample_rate * self.channels * self.RING_SECONDS
+        self._ring = np.zeros(self._ring_size, dtype=np.int16)
+        self._write_pos = 0  # total samples ever written
+        self._read_pos = 0  # total samples ever read
+
+        # Cache per-frame constants and bind the channel-specific enqueue
+        # path once instead of re-deciding them per delta
+        self._layout = "mono" if self.channels == 1 else "stereo"
+        self._time_base = fractions.Fraction(1, self.sample_rate)
+        self.enqueue_audio = (
+            self._enqueue_mono if self.channels == 1 else self._enqueue_multi
+        )
+
+        # Pre-built silence frames reused whenever the ring underflows; a
+        # small ring in case the encoder still holds the last returned one
+        self._silence_frames = []
+        for _ in range(3):
+            silence = AudioFrame(
+                format="s16",
+                layout=self._layout,
+                samples=self.frame_samples,
+            )
+            for p in silence.planes:
+                p.update(bytes(self.frame_samples * self.sample_width * self.channels))
+
+            silence.sample_rate = self.sample_rate
+            silence.time_base = self._time_base
+            self._silence_frames.append(silence)
+
+        self._silence_index = 0
+
+    def _ring_write(self, samples: np.ndarray):
+        """Copy interleaved int16 samples into the ring (producer side)"""
+        count = samples.size
+
+        if count == 0:
+            return
+
+        if count > self._ring_size:
+            # Keep only the newest ring's worth of samples
+            samples = samples[-self._ring_size :]
+            count = samples.size
+
+        start = self._write_pos % self._ring_size
+        end = start + count
+
+        if end <= self._ring_size:
+            self._ring[start:end] = samples
+        else:
+            split = self._ring_size - start
+            self._ring[start:] = samples[:split]
+            self._ring[: count - split] = samples[split:]
+
+        self._write_pos += count
+
+    def _ring_read(self, count: int):
+        """Read exactly `count` samples from the ring, or None on underflow"""
+        available = self._write_pos - self._read_pos
 
-    def enqueue_audio(self, base64_audio: str):
-        """Process and add audio data directly to the AudioFifo"""
+        if available > self._ring_size:
+            # Producer lapped us; skip ahead to the oldest valid sample
+            self._read_pos = self._write_pos - self._ring_size
+            available = self._ring_size
+
+        if available < count:
+            return None
+
+        start = self._read_pos % self._ring_size
+        end = start + count
+
+        if end <= self._ring_size:
+            samples = self._ring[start:end]
+        else:
+            samples = np.concatenate(
+                (self._ring[start:], self._ring[: end - self._ring_size])
+            )
+
+        self._read_pos += count
+
+        return samples
+
+    def _enqueue_mono(self, base64_audio: str):
+        """Process and add mono audio data directly to the ring buffer"""
         if self.readyState != "live":
             return
 
         try:
-            audio_bytes = base64.b64decode(base64_audio)
-            audio_array = np.frombuffer(audio_bytes, dtype=np.int16)
-            audio_array = audio_array.reshape(self.channels, -1)
+            # Decode into a mutable bytearray so the ndarray below is a
+            # zero-copy view rather than a copy of an immutable bytes object
+            pcm_buffer = pybase64.b64decode_as_bytearray(base64_audio, validate=False)
+            self._ring_write(np.frombuffer(pcm_buffer, dtype=np.int16))
 
-            frame = AudioFrame.from_ndarray(
-                audio_array,
-                format="s16",
-                layout="mono" if self.channels == 1 else "stereo",
-            )
-            frame.sample_rate = self.sample_rate
-            frame.time_base = fractions.Fraction(1, self.sample_rate)
+        except Exception as e:
+            logger.error(f"Error in enqueue_audio: {e}", exc_info=True)
 
-            with self.fifo_lock:
-                self.audio_fifo.write(frame)
+    def _enqueue_multi(self, base64_audio: str):
+        """Process and add multi-channel audio data directly to the ring buffer"""
+        if self.readyState != "live":
+            return
+
+        try:
+            # Samples stay interleaved in the ring; recv reads whole
+            # packed frames back out
+            pcm_buffer = pybase64.b64decode_as_bytearray(base64_audio, validate=False)
+
+            # Interleaved layouts must stay frame-aligned: drop any
+            # trailing partial frame so channels can't swap across
+            # writes (mono has no alignment to lose)
+            remainder = len(pcm_buffer) % (self.channels * self.sample_width)
+            if remainder:
+                del pcm_buffer[-remainder:]
+
+            self._ring_write(np.frombuffer(pcm_buffer, dtype=np.int16))
 
         except Exception as e:
             logger.error(f"Error in enqueue_audio: {e}", exc_info=True)
 
     def flush_audio(self):
-        """Flush the audio FIFO buffer"""
-        with self.fifo_lock:
-            self.audio_fifo = AudioFifo()
+        """Flush any buffered audio samples"""
+        self._read_pos = self._write_pos
 
     async def recv(self) -> AudioFrame:
         """Receive the next audio frame"""
@@ -68,40 +164,52 @@ class BotAudioTrack(MediaStreamTrack):
             raise MediaStreamError
 
         if self._start is None:
-            self._start = asyncio.get_event_loop().time()
+            self._loop = asyncio.get_running_loop()
+            self._start = self._loop.time()
             self._timestamp = 0
 
         samples = self.frame_samples
         self._timestamp += samples
 
-        target_time = self._start + (self._timestamp / self.sample_rate)
-        current_time = asyncio.get_event_loop().time()
-        wait = target_time - current_time
+        target_time = self._start + self._timestamp * self._sample_period
+        wait = target_time - self._loop.time()
 
         if wait > 0:
             await asyncio.sleep(wait)
 
         try:
-            # Read frames from the FIFO buffer
-            with self.fifo_lock:
-                frame = self.audio_fifo.read(samples)
-
-            if frame is None:
-                # If no data is available, generate silence
-                frame = AudioFrame(
-                    format="s16",
-                    layout="mono" if self.channels == 1 else "stereo",
-                    samples=samples,
-                )
-                for p in frame.planes:
-                    p.update(np.zeros(samples, dtype=np.int16).tobytes())
-
-                frame.sample_rate = self.sample_rate
-                frame.time_base = fractions.Fraction(1, self.sample_rate)
+            # Read one packetization window from the ring buffer
+            needed = samples * self.channels
+            chunk = self._ring_read(needed)
+
+            if chunk is None:
+                available = self._write_pos - self._read_pos
+
+                if available > 0:
+                    # Partial underflow: emit what we have and zero-pad
+                    # the tail instead of discarding real audio
+                    partial = self._ring_read(available)
+                    padded = np.empty((1, needed), dtype=np.int16)
+                    padded[0, :available] = partial
+                    padded[0, available:] = 0
+
+                    frame = AudioFrame.from_ndarray(
+                        padded, format="s16", layout=self._layout
+                    )
+                    frame.sample_rate = self.sample_rate
+                    frame.time_base = self._time_base
+                else:
+                    # If no data is available, reuse a pre-built silence frame
+                    frame = self._silence_frames[self._silence_index]
+                    self._silence_index = (self._silence_index + 1) % len(
+                        self._silence_frames
+                    )
             else:
-                # Update frame properties
+                frame = AudioFrame.from_ndarray(
+                    chunk[np.newaxis, :], format="s16", layout=self._layout
+                )
                 frame.sample_rate = self.sample_rate
-                frame.time_base = fractions.Fraction(1, self.sample_rate)
+                frame.time_base = self._time_base
 
             # Set frame PTS
             frame.pts = self._timestamp
@@ -2,46 +2,127 @@ import asyncio
 import logging
 from typing import Callable
 
+import numpy as np
 from av import AudioFrame, AudioResampler
 from av.audio.fifo import AudioFifo
+from scipy.signal import firwin
 
 logger = logging.getLogger(__name__)
 
 audio_fifo = AudioFifo()
 
+# Signals push_to_callback that new frames arrived, so the consumer wakes
+# immediately instead of polling the FIFO on a fixed sleep
+_frame_event = asyncio.Event()
+
+# Fallback for anything that is not the fixed 48 kHz s16 fast path
 resampler = AudioResampler(
     format="s16",
     layout="mono",
     rate=16000,
 )
 
+_DECIMATION = 3  # 48 kHz -> 16 kHz
+_FIR_TAPS = 48
+_fir = firwin(_FIR_TAPS, 7600, fs=48000).astype(np.float32)
+
+
+class _PolyphaseDecimator:
+    """Streaming 48 kHz -> 16 kHz decimator backed by a fixed FIR.
+
+    Carries filter history and decimation phase across frames so chunk
+    boundaries stay artifact-free, without libswresample's per-frame
+    object churn.
+    """
+
+    def __init__(self):
+        self._history = np.zeros(_FIR_TAPS - 1, dtype=np.float32)
+        self._phase = 0
+
+    def process(self, mono: np.ndarray) -> np.ndarray:
+        """Filter and decimate one frame of mono samples."""
+        return self._filter(mono.astype(np.float32))
+
+    def process_stereo(self, interleaved: np.ndarray) -> np.ndarray:
+        """Downmix interleaved stereo and decimate in one float32 pass.
+
+        Folding the L/R average into the float32 conversion keeps the
+        whole frame in a single cache-friendly buffer instead of a
+        separate float64 downmix followed by the filter.
+        """
+        pairs = interleaved.astype(np.float32).reshape(-1, 2)
+        mono = pairs.sum(axis=1)
+        mono *= 0.5
+
+        return self._filter(mono)
+
+    def _filter(self, mono: np.ndarray) -> np.ndarray:
+        buf = np.concatenate((self._history, mono))
+        filtered = np.convolve(buf, _fir, mode="valid")
+
+        out = filtered[self._phase :: _DECIMATION]
+
+        self._phase = (self._phase - filtered.size) % _DECIMATION
+        self._history = buf[1 - _FIR_TAPS :]
+
+        # The FIR overshoots full-scale input; saturate like
+        # libswresample instead of letting the int16 cast wrap
+        return np.clip(out, -32768, 32767).astype(np.int16)
+
+
+_decimator = _PolyphaseDecimator()
+
 
 def push_room_audio_frame(frame: AudioFrame):
-    """Asynchronously write frames to the AudioFifo buffer."""
-    resampled_frames = resampler.resample(frame)
+    """Resample room audio to 16 kHz mono and write it to the AudioFifo buffer."""
+    if frame.sample_rate == 48000 and frame.format.name == "s16":
+        pcm = frame.to_ndarray()
+
+        if len(frame.layout.channels) == 2:
+            # Packed s16 stereo is interleaved L/R
+            mono_16k = _decimator.process_stereo(pcm[0])
+        else:
+            mono_16k = _decimator.process(pcm[0])
 
-    for resampled_frame in resampled_frames:
-        audio_fifo.write(resampled_frame)
+        if mono_16k.size:
+            out = AudioFrame.from_ndarray(
+                mono_16k[np.newaxis, :], format="s16", layout="mono"
+            )
+            out.sample_rate = 16000
+            audio_fifo.write(out)
+    else:
+        for resampled_frame in resampler.resample(frame):
+            audio_fifo.write(resampled_frame)
 
+    _frame_event.set()
 
-# The audio_callback function is called with the base64-encoded audio data
+
+# The audio_callback function is called with a memoryview of raw PCM data
 # The block size for each audio chunk has to be 4096
 async def push_to_callback(audio_callback: Callable):
-    """Asynchronously read frames from AudioFifo and send base64-encoded PCM data."""
+    """Asynchronously read frames from AudioFifo and send raw PCM data."""
 
     while True:
         try:
             frame = audio_fifo.read()
 
             if frame is None:
-                await asyncio.sleep(0.01)
-                continue
+                _frame_event.clear()
+
+                # Re-check after clearing so a frame written in between
+                # is not missed
+                frame = audio_fifo.read()
 
-            pcm_data = frame.to_ndarray()
+                if frame is None:
+                    await _frame_event.wait()
+                    continue
 
-            pcm_bytes = pcm_data.tobytes()
+            # Hand the frame's buffer over as a memoryview; downstream
+            # consumers (base64 encode, bytearray extend) all accept
+            # buffer-protocol objects, so no intermediate bytes copy
+            pcm_view = memoryview(frame.to_ndarray()).cast("B")
 
-            await audio_callback(pcm_bytes)
+            await audio_callback(pcm_view)
         except Exception as e:
             logger.error(f"Error sending audio chunk: {e}", exc_info=True)
             break  # Exit the loop on error
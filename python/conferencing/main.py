@@ -1,8 +1,8 @@
 import asyncio
-import json
 import logging
 import os
 
+import orjson
 from dotenv import load_dotenv
 
 from .audio_from_room import (
@@ -86,9 +86,9 @@ async def main():
 
     transcribe_bot = Transcribe()
 
-    async def audio_callback(encoded_data: bytes):
-        transcribe_bot.send_audio_byte(encoded_data)
-        await openBot.send_audio_chunks(encoded_data)
+    async def audio_callback(pcm: memoryview):
+        transcribe_bot.send_audio_byte(pcm)
+        await openBot.send_audio_chunks(pcm)
 
     asyncio.create_task(
         push_to_callback(audio_callback=audio_callback),
@@ -108,7 +108,9 @@ async def main():
     @transcribe_bot.on("transcription")
     def on_transcription(transcription: TranscriptionResult):
         logger.info(f"Transcription: {transcription.text}")
-        json_payload = json.dumps({"message": transcription.text, "name": "Ai Bot"})
+        json_payload = orjson.dumps(
+            {"message": transcription.text, "name": "Ai Bot"}
+        ).decode("utf-8")
         if transcription.is_final:
             asyncio.run_coroutine_threadsafe(
                 room.local_peer.send_volatile_data(
@@ -1,9 +1,9 @@
 import asyncio
-import base64
 import logging
 from typing import Callable
 
 import numpy as np
+import pybase64
 import sounddevice as sd
 
 logger = logging.getLogger(__name__)
@@ -14,7 +14,9 @@ async def send_input_device_stream(future: asyncio.Future, audio_callback: Calla
         indata: np.ndarray, frames: int, time_info: dict, status: sd.CallbackFlags
     ) -> None:
         try:
-            pcm_base64 = base64.b64encode(indata).decode("utf-8")
+            # b64encode_as_string builds the str directly in C, skipping
+            # the bytes round trip and UTF-8 validation of .decode()
+            pcm_base64 = pybase64.b64encode_as_string(indata)
             asyncio.run(audio_callback(pcm_base64))
 
         except Exception as e:
@@ -1,60 +1,183 @@
+import itertools
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import time
+from dataclasses import dataclass
 from typing import Optional
 
 from google.cloud.speech_v2 import SpeechClient
+from google.cloud.speech_v2.services.speech.transports import SpeechGrpcTransport
 from google.cloud.speech_v2.types import cloud_speech as cloud_speech_types
 from google.oauth2 import service_account
-from pydantic import BaseModel
 
 from huddle01.emitter import EnhancedEventEmitter
 
 logger = logging.getLogger("transcribe")
 
+_credentials = None
+_client: Optional[SpeechClient] = None
 
-class TranscriptionResult(BaseModel):
-    """Structured container for transcription results."""
+# Keep the shared channel alive through quiet periods and leave headroom
+# for many concurrent bidi streams
+_GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_concurrent_streams", 100),
+]
+
+
+def _get_client() -> SpeechClient:
+    """Shared SpeechClient for all Transcribe instances.
+
+    Parsing the service-account file (JSON read + RSA key decode) and
+    building the gRPC channel are expensive, so do both once; channels
+    are thread-safe and meant to be reused.
+    """
+    global _credentials, _client
+
+    if _client is None:
+        _credentials = service_account.Credentials.from_service_account_file(
+            os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "key.json")
+        )
+
+        channel = SpeechGrpcTransport.create_channel(
+            credentials=_credentials,
+            options=_GRPC_CHANNEL_OPTIONS,
+        )
+        _client = SpeechClient(transport=SpeechGrpcTransport(channel=channel))
+
+    return _client
+
+
+@dataclass(slots=True, frozen=True)
+class TranscriptionResult:
+    """Structured container for transcription results.
+
+    A plain dataclass: results are only emitted internally, so Pydantic
+    validation on this per-result hot path buys nothing.
+    """
 
     text: str
     is_final: bool
     confidence: float
-    alternatives: list
+    alternatives: tuple
 
 
 class AudioProcessor:
     MAX_CHUNK_SIZE = 25600
     PREFERRED_CHUNK_SIZE = 24576
 
-    def __init__(self):
-        self.buffer = bytearray()
+    # Power-of-two ring capacity (4x MAX_CHUNK_SIZE rounded up) so the
+    # wrap-around index math is a single mask
+    CAPACITY = 1 << 17
 
-    def add_audio(self, audio_data: bytes) -> list[bytes]:
+    def __init__(self):
+        # Fixed SPSC ring: the audio callback is the only writer of
+        # _write and the chunk consumer the only writer of _read, so the
+        # cursors need no lock and pushes never realloc
+        self._buf = bytearray(self.CAPACITY)
+        self._mask = self.CAPACITY - 1
+        self._write = 0  # total bytes ever written
+        self._read = 0  # total bytes ever consumed
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes not yet returned as chunks."""
+        return self._write - self._read
+
+    def write(self, audio_data):
+        """Buffer audio into the ring without draining any chunks."""
+        length = len(audio_data)
+
+        if not length:
+            return
+
+        if self.pending + length > self.CAPACITY:
+            # Drop the oldest audio rather than stalling the realtime
+            # producer
+            self._read = self._write + length - self.CAPACITY
+
+        start = self._write & self._mask
+        end = start + length
+
+        if end <= self.CAPACITY:
+            self._buf[start:end] = audio_data
+        else:
+            split = self.CAPACITY - start
+            self._buf[start:] = audio_data[:split]
+            self._buf[: length - split] = audio_data[split:]
+
+        self._write += length
+
+    def add_audio(self, audio_data) -> list:
         """
-        Adds audio data to buffer and returns complete chunks.
+        Adds audio data to the ring and returns complete chunks.
 
         Args:
-            audio_data: Raw audio bytes to process
+            audio_data: Raw audio as any bytes-like object
 
         Returns:
-            List of properly sized chunks ready for transmission
+            List of properly sized bytes-like chunks; contiguous spans are
+            zero-copy memoryviews into the ring, so callers must consume
+            them promptly and copy only at the protobuf boundary
         """
-        self.buffer.extend(audio_data)
+        self.write(audio_data)
+
+        # Hoist constants and bound methods into locals: LOAD_FAST beats
+        # LOAD_ATTR in a loop that runs 100+ times/sec per user
+        size = self.PREFERRED_CHUNK_SIZE
+        max_size = self.MAX_CHUNK_SIZE
+        read_view = self._read_view
+        pending = self._write - self._read
 
         chunks = []
+        append = chunks.append
 
-        while len(self.buffer) >= self.PREFERRED_CHUNK_SIZE:
-            chunk = bytes(self.buffer[: self.PREFERRED_CHUNK_SIZE])
-            chunks.append(chunk)
-            self.buffer = self.buffer[self.PREFERRED_CHUNK_SIZE :]
+        # Fill each chunk up to the API's per-message cap so the same
+        # audio travels in fewer, larger requests
+        while pending >= size:
+            count = pending if pending < max_size else max_size
+            append(read_view(count))
+            pending -= count
 
         return chunks
 
-    def get_remaining(self) -> Optional[bytes]:
-        """Returns any remaining audio data in the buffer."""
-        if self.buffer:
-            return bytes(self.buffer)
-        return None
+    def _read_view(self, count: int):
+        """View `count` bytes of the ring and advance the read cursor.
+
+        Contiguous spans come back as zero-copy memoryviews; only a
+        wrapped span is joined into a fresh bytes object.
+        """
+        start = self._read & self._mask
+        end = start + count
+
+        if end <= self.CAPACITY:
+            out = memoryview(self._buf)[start:end]
+        else:
+            view = memoryview(self._buf)
+            out = bytes(view[start:]) + bytes(view[: end - self.CAPACITY])
+
+        self._read += count
+
+        return out
+
+    def get_remaining(self):
+        """Drains and returns any remaining audio data in the buffer.
+
+        A contiguous tail comes back as a zero-copy memoryview into the
+        ring (a wrapped one is joined once); the caller copies only at
+        the protobuf boundary, and the read cursor advances so the ring
+        is left empty without any deallocation.
+        """
+        pending = self.pending
+
+        if not pending:
+            return None
+
+        return self._read_view(pending)
 
 
 class Transcribe(EnhancedEventEmitter):
@@ -65,15 +188,34 @@ class Transcribe(EnhancedEventEmitter):
         if not self.PROJECT_ID:
             raise ValueError("GOOGLE_CLOUD_PROJECT environment variable not set.")
 
-        self.client = SpeechClient(
-            credentials=service_account.Credentials.from_service_account_file(
-                "key.json"
-            )
-        )
+        self.client = _get_client()
 
         self.audio_processor = AudioProcessor()
 
-        self.executor = ThreadPoolExecutor(max_workers=5)
+        # Recognizer resource path is fixed per project; build it once
+        self._recognizer_path = (
+            f"projects/{self.PROJECT_ID}/locations/global/recognizers/_"
+        )
+
+        # The streaming config never changes, so build the request once
+        # instead of reconstructing the nested protos per audio push
+        self._streaming_request = self._create_streaming_config()
+
+        # Listener callbacks run on a dedicated dispatcher thread so a
+        # slow subscriber can't stall the gRPC response reader and back
+        # up Google's stream. Started before the stream thread, which
+        # queues emits as soon as responses arrive
+        self._emit_queue = queue.Queue(maxsize=256)
+        self._emit_thread = threading.Thread(target=self._emit_loop, daemon=True)
+        self._emit_thread.start()
+
+        # One long-lived bidi stream fed from this queue by a single
+        # consumer thread, so chunks stay in order. Bounded so a stalled
+        # stream can't accumulate audio without limit
+        self._request_queue = queue.Queue(maxsize=64)
+        self._dropped_requests = 0
+        self._stream_thread = threading.Thread(target=self._run_stream, daemon=True)
+        self._stream_thread.start()
 
     def _create_streaming_config(self) -> cloud_speech_types.StreamingRecognizeRequest:
         """Creates the streaming configuration for the Speech API."""
@@ -89,62 +231,166 @@ class Transcribe(EnhancedEventEmitter):
             language_codes=["en-US"],
         )
 
+        # The app only acts on final transcripts, so skip the stream of
+        # interim partials entirely; voice-activity events still mark
+        # speech boundaries cheaply
+        streaming_features = cloud_speech_types.StreamingRecognitionFeatures(
+            interim_results=False,
+            enable_voice_activity_events=True,
+        )
+
         streaming_config = cloud_speech_types.StreamingRecognitionConfig(
             config=recognition_config,
+            streaming_features=streaming_features,
         )
 
         return cloud_speech_types.StreamingRecognizeRequest(
-            recognizer=f"projects/{self.PROJECT_ID}/locations/global/recognizers/_",
+            recognizer=self._recognizer_path,
             streaming_config=streaming_config,
         )
 
-    def _transcribe_response(self, streaming_request, audio_chunk: list[bytes]):
-        """Handles the transcription response."""
+    def _emit_loop(self):
+        """Drains queued events and runs listeners off the reader thread."""
+        while True:
+            event, payload = self._emit_queue.get()
 
-        audio_requests = (
-            cloud_speech_types.StreamingRecognizeRequest(audio=audio)
-            for audio in audio_chunk
-        )
-
-        def request_generator():
-            yield streaming_request
-            yield from audio_requests
+            try:
+                super(Transcribe, self).emit(event, payload)
+            except Exception as e:
+                logger.exception("Transcription listener failed: %s", e)
 
-        responses_iterator = self.client.streaming_recognize(
-            requests=request_generator()
-        )
-
-        responses = []
-        for response in responses_iterator:
-            responses.append(response)
-
-            for result in response.results:
-                if result.alternatives:
-                    t = TranscriptionResult(
-                        text=result.alternatives[0].transcript,
-                        is_final=result.is_final,
-                        confidence=result.alternatives[0].confidence,
-                        alternatives=[
-                            {"transcript": alt.transcript, "confidence": alt.confidence}
-                            for alt in result.alternatives[1:]
-                        ],
+    def _queue_emit(self, event: str, payload):
+        """Hands an event to the dispatcher thread, shedding the oldest
+        queued event instead of ever blocking the reader."""
+        try:
+            self._emit_queue.put_nowait((event, payload))
+        except queue.Full:
+            try:
+                self._emit_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            self._emit_queue.put_nowait((event, payload))
+
+    def _run_stream(self):
+        """Owns the long-lived bidi stream and drains its responses."""
+        backoff = 1.0
+
+        while True:
+            # Each stream gets its own queue: gRPC keeps a request
+            # consumer blocked in the iterator even after the call dies,
+            # and sharing a queue would let that dead consumer steal
+            # audio meant for the replacement stream
+            request_queue = self._request_queue
+
+            try:
+                # Config request first, then audio requests straight off
+                # the queue; iter's sentinel form ends the stream on None
+                responses_iterator = self.client.streaming_recognize(
+                    requests=itertools.chain(
+                        (self._streaming_request,),
+                        iter(request_queue.get, None),
                     )
-
-                    self.emit("transcription", t)
-
-    def send_audio_byte(self, audio: bytes):
+                )
+
+                for response in responses_iterator:
+                    backoff = 1.0
+
+                    for result in response.results:
+                        if result.alternatives:
+                            # islice skips the top alternative without
+                            # the [1:] list copy per result
+                            alternatives = tuple(
+                                (alt.transcript, alt.confidence)
+                                for alt in itertools.islice(
+                                    result.alternatives, 1, None
+                                )
+                            )
+
+                            t = TranscriptionResult(
+                                text=result.alternatives[0].transcript,
+                                is_final=result.is_final,
+                                confidence=result.alternatives[0].confidence,
+                                alternatives=alternatives,
+                            )
+
+                            self._queue_emit("transcription", t)
+
+                # Google closes streams after ~5 minutes; fall through
+                # and reopen with a fresh queue
+            except Exception as e:
+                logger.error(f"Streaming recognition failed, reopening: {e}")
+
+                # A fast-failing RPC (missing key, bad project, quota)
+                # would otherwise reopen in a tight loop
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 10.0)
+
+            # Swap in a fresh queue for the producer, then push the
+            # end-of-stream sentinel into the old one so the dead call's
+            # consumer unblocks and exits instead of leaking. Shedding an
+            # entry on Full is fine: that audio belonged to the dead
+            # stream anyway
+            self._request_queue = queue.Queue(maxsize=64)
+
+            while True:
+                try:
+                    request_queue.put_nowait(None)
+                    break
+                except queue.Full:
+                    try:
+                        request_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+
+    def send_audio_byte(self, audio: bytes | memoryview):
         try:
-            streaming_request = self._create_streaming_config()
+            processor = self.audio_processor
+
+            # Fast path for the ~100/s sub-watermark pushes: nothing can
+            # be ready yet, so just buffer and skip the chunk machinery
+            if processor.pending + len(audio) < AudioProcessor.PREFERRED_CHUNK_SIZE:
+                processor.write(audio)
+                return
 
-            audio_chunk = self.audio_processor.add_audio(audio)
+            audio_chunk = processor.add_audio(audio)
 
             if len(audio_chunk) == 0:
                 return
 
-            self.executor.submit(
-                self._transcribe_response, streaming_request, audio_chunk
-            )
+            # Snapshot the queue so the put/shed pair below always hits
+            # the same object even if the stream thread rotates queues
+            # mid-call
+            request_queue = self._request_queue
+
+            for chunk in audio_chunk:
+                # The proto field needs real bytes; this is the single
+                # copy on the ingestion path
+                request = cloud_speech_types.StreamingRecognizeRequest(
+                    audio=bytes(chunk)
+                )
+
+                try:
+                    request_queue.put_nowait(request)
+                except queue.Full:
+                    # Keep the audio path realtime: shed the oldest
+                    # pending request instead of blocking the producer
+                    try:
+                        request_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+
+                    request_queue.put_nowait(request)
+
+                    self._dropped_requests += 1
+                    if self._dropped_requests % 50 == 1:
+                        logger.warning(
+                            "STT stream saturated; %d audio requests dropped so far",
+                            self._dropped_requests,
+                        )
 
         except Exception as e:
-            print(f"Error sending audio chunk: {str(e)}")
+            # %-style args defer formatting until a handler is enabled,
+            # and the logger never takes the stdout lock like print does
+            logger.exception("Error sending audio chunk: %s", e)
             raise